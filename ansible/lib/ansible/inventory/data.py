@@ -208,6 +208,21 @@ class InventoryData(object):
         inv_object.set_variable(varname, value)
         display.debug('set %s for %s' % (varname, entity))
 
+    def set_variables(self, entity, variables):
+        ''' sets several variables for an inventory object in one pass '''
+
+        if entity in self.groups:
+            inv_object = self.groups[entity]
+            # groups special case some keys, so they go through set_variable
+            for varname in variables:
+                inv_object.set_variable(varname, variables[varname])
+        elif entity in self.hosts:
+            self.hosts[entity].vars.update(variables)
+        else:
+            raise AnsibleError("Could not identify group or host named %s" % entity)
+
+        display.debug('set %s for %s' % (list(variables), entity))
+
     def add_child(self, group, child):
         ''' Add host or group to group '''
 
@@ -224,6 +239,22 @@ class InventoryData(object):
         else:
             raise AnsibleError("%s is not a known group" % group)
 
+    def add_host_to_groups(self, host, groups):
+        ''' adds a known host to several groups, creating the ones not there already '''
+
+        if host not in self.hosts:
+            raise AnsibleError("%s is not a known host" % host)
+
+        h = self.hosts[host]
+        for group in groups:
+            if group not in self.groups:
+                self.groups[group] = Group(group)
+                display.debug("Added group %s to inventory" % group)
+            self.groups[group].add_host(h)
+
+        self._groups_dict_cache = {}
+        display.debug('Host %s now in groups %s' % (host, ', '.join(groups)))
+
     def get_groups_dict(self):
         """
         We merge a 'magic' var 'groups' with group name keys and hostname list values into every host variable set. Cache for speed.
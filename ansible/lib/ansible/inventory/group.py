@@ -83,7 +83,7 @@ class Group:
     @property
     def host_names(self):
         if self._hosts is None:
-            self._hosts = set(self.hosts)
+            self._hosts = set(h.name for h in self.hosts)
         return self._hosts
 
     def get_name(self):
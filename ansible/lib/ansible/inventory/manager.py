@@ -165,6 +165,9 @@ class InventoryManager(object):
     def add_group(self, group):
         return self._inventory.add_group(group)
 
+    def add_host_to_groups(self, host, groups):
+        return self._inventory.add_host_to_groups(host, groups)
+
     def get_groups_dict(self):
         return self._inventory.get_groups_dict()
 
@@ -33,12 +33,14 @@
 
 from __future__ import absolute_import
 import os
-from pkg_resources import parse_version
 
 HAS_AVI = True
 try:
     import avi.sdk
     sdk_version = getattr(avi.sdk, '__version__', None)
+    # pkg_resources is slow to import, so it is only loaded when the sdk is
+    # installed and its version needs checking
+    from pkg_resources import parse_version
     if ((sdk_version is None) or (sdk_version and (parse_version(sdk_version) < parse_version('17.1')))):
         # It allows the __version__ to be '' as that value is used in development builds
         raise ImportError
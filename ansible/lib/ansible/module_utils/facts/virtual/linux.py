@@ -16,13 +16,73 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-import glob
 import os
 import re
 
 from ansible.module_utils.facts.virtual.base import Virtual, VirtualCollector
 from ansible.module_utils.facts.utils import get_file_content, get_file_lines
 
+# patterns matched against every line of the files checked below
+DOCKER_CGROUP_RE = re.compile(r'/docker(/|-[0-9a-f]+\.scope)')
+LXC_CGROUP_RE = re.compile(r'/lxc/|/machine.slice/machine-lxc')
+VXID_RE = re.compile(r'^VxID:\s+\d+')
+VXID_HOST_RE = re.compile(r'^VxID:\s+0')
+
+# the cpuinfo checks, tried in this order, and the virtualization_type for each
+CPUINFO_RE = re.compile(r'^(?:model name.*(?P<qemu>QEMU Virtual CPU)'
+                        r'|vendor_id.*(?P<uml_vendor>User Mode Linux)'
+                        r'|model name.*(?P<uml_model>UML)'
+                        r'|vendor_id.*(?P<powervm>PowerVM Lx86)'
+                        r'|vendor_id.*(?P<s390>IBM/S390))')
+CPUINFO_VIRTUALIZATION_TYPES = {
+    'qemu': 'kvm',
+    'uml_vendor': 'uml',
+    'uml_model': 'uml',
+    'powervm': 'powervm_lx86',
+    's390': 'PR/SM',
+}
+
+DMI_VIRTUALIZATION_TYPES = (
+    ('product_name', {
+        'KVM': 'kvm',
+        'Bochs': 'kvm',
+        'RHEV Hypervisor': 'RHEV',
+        'VMware Virtual Platform': 'VMware',
+        'VMware7,1': 'VMware',
+        'OpenStack Nova': 'openstack',
+    }),
+    ('bios_vendor', {
+        'Xen': 'xen',
+        'innotek GmbH': 'virtualbox',
+        'Amazon EC2': 'kvm',
+    }),
+    ('sys_vendor', {
+        # FIXME: This does also match hyperv
+        'Microsoft Corporation': 'VirtualPC',
+        'Parallels Software International Inc.': 'parallels',
+        'QEMU': 'kvm',
+        'oVirt': 'kvm',
+        'OpenStack Foundation': 'openstack',
+        'Amazon EC2': 'kvm',
+    }),
+)
+
+
+def get_first_record_lines(path):
+    '''yields the lines of a file up to the first blank line'''
+    try:
+        datafile = open(path)
+    except (IOError, OSError):
+        return
+    try:
+        for line in datafile:
+            line = line.rstrip()
+            if not line:
+                break
+            yield line
+    finally:
+        datafile.close()
+
 
 class LinuxVirtual(Virtual):
     """
@@ -38,11 +98,11 @@ class LinuxVirtual(Virtual):
         # lxc/docker
         if os.path.exists('/proc/1/cgroup'):
             for line in get_file_lines('/proc/1/cgroup'):
-                if re.search(r'/docker(/|-[0-9a-f]+\.scope)', line):
+                if DOCKER_CGROUP_RE.search(line):
                     virtual_facts['virtualization_type'] = 'docker'
                     virtual_facts['virtualization_role'] = 'guest'
                     return virtual_facts
-                if re.search('/lxc/', line) or re.search('/machine.slice/machine-lxc', line):
+                if LXC_CGROUP_RE.search(line):
                     virtual_facts['virtualization_type'] = 'lxc'
                     virtual_facts['virtualization_role'] = 'guest'
                     return virtual_facts
@@ -50,7 +110,7 @@ class LinuxVirtual(Virtual):
         # lxc does not always appear in cgroups anymore but sets 'container=lxc' environment var, requires root privs
         if os.path.exists('/proc/1/environ'):
             for line in get_file_lines('/proc/1/environ'):
-                if re.search('container=lxc', line):
+                if 'container=lxc' in line:
                     virtual_facts['virtualization_type'] = 'lxc'
                     virtual_facts['virtualization_role'] = 'guest'
                     return virtual_facts
@@ -80,100 +140,33 @@ class LinuxVirtual(Virtual):
                 pass
             return virtual_facts
 
-        product_name = get_file_content('/sys/devices/virtual/dmi/id/product_name')
-
-        if product_name in ['KVM', 'Bochs']:
-            virtual_facts['virtualization_type'] = 'kvm'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
-
-        if product_name == 'RHEV Hypervisor':
-            virtual_facts['virtualization_type'] = 'RHEV'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
-
-        if product_name in ['VMware Virtual Platform', 'VMware7,1']:
-            virtual_facts['virtualization_type'] = 'VMware'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
-
-        if product_name == 'OpenStack Nova':
-            virtual_facts['virtualization_type'] = 'openstack'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
-
-        bios_vendor = get_file_content('/sys/devices/virtual/dmi/id/bios_vendor')
-
-        if bios_vendor == 'Xen':
-            virtual_facts['virtualization_type'] = 'xen'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
-
-        if bios_vendor == 'innotek GmbH':
-            virtual_facts['virtualization_type'] = 'virtualbox'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
-
-        if bios_vendor == 'Amazon EC2':
-            virtual_facts['virtualization_type'] = 'kvm'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
-
-        sys_vendor = get_file_content('/sys/devices/virtual/dmi/id/sys_vendor')
-
-        # FIXME: This does also match hyperv
-        if sys_vendor == 'Microsoft Corporation':
-            virtual_facts['virtualization_type'] = 'VirtualPC'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
-
-        if sys_vendor == 'Parallels Software International Inc.':
-            virtual_facts['virtualization_type'] = 'parallels'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
-
-        if sys_vendor == 'QEMU':
-            virtual_facts['virtualization_type'] = 'kvm'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
-
-        if sys_vendor == 'oVirt':
-            virtual_facts['virtualization_type'] = 'kvm'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
-
-        if sys_vendor == 'OpenStack Foundation':
-            virtual_facts['virtualization_type'] = 'openstack'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
-
-        if sys_vendor == 'Amazon EC2':
-            virtual_facts['virtualization_type'] = 'kvm'
-            virtual_facts['virtualization_role'] = 'guest'
-            return virtual_facts
+        # the dmi values which identify a guest, checked in this order
+        for dmi_file, virtualization_types in DMI_VIRTUALIZATION_TYPES:
+            dmi_value = get_file_content('/sys/devices/virtual/dmi/id/%s' % dmi_file)
+            if dmi_value in virtualization_types:
+                virtual_facts['virtualization_type'] = virtualization_types[dmi_value]
+                virtual_facts['virtualization_role'] = 'guest'
+                return virtual_facts
 
         if os.path.exists('/proc/self/status'):
             for line in get_file_lines('/proc/self/status'):
-                if re.match(r'^VxID:\s+\d+', line):
+                if VXID_RE.match(line):
                     virtual_facts['virtualization_type'] = 'linux_vserver'
-                    if re.match(r'^VxID:\s+0', line):
+                    if VXID_HOST_RE.match(line):
                         virtual_facts['virtualization_role'] = 'host'
                     else:
                         virtual_facts['virtualization_role'] = 'guest'
                     return virtual_facts
 
         if os.path.exists('/proc/cpuinfo'):
-            for line in get_file_lines('/proc/cpuinfo'):
-                if re.match('^model name.*QEMU Virtual CPU', line):
-                    virtual_facts['virtualization_type'] = 'kvm'
-                elif re.match('^vendor_id.*User Mode Linux', line):
-                    virtual_facts['virtualization_type'] = 'uml'
-                elif re.match('^model name.*UML', line):
-                    virtual_facts['virtualization_type'] = 'uml'
-                elif re.match('^vendor_id.*PowerVM Lx86', line):
-                    virtual_facts['virtualization_type'] = 'powervm_lx86'
-                elif re.match('^vendor_id.*IBM/S390', line):
-                    virtual_facts['virtualization_type'] = 'PR/SM'
+            # the vendor and model are the same for every processor, so only
+            # the record for the first one is read
+            for line in get_first_record_lines('/proc/cpuinfo'):
+                match = CPUINFO_RE.match(line)
+                if match is None:
+                    continue
+                virtual_facts['virtualization_type'] = CPUINFO_VIRTUALIZATION_TYPES[match.lastgroup]
+                if match.lastgroup == 's390':
                     lscpu = self.module.get_bin_path('lscpu')
                     if lscpu:
                         rc, out, err = self.module.run_command(["lscpu"])
@@ -185,8 +178,6 @@ class LinuxVirtual(Virtual):
                                     virtual_facts['virtualization_type'] = data[1].strip()
                     else:
                         virtual_facts['virtualization_type'] = 'ibm_systemz'
-                else:
-                    continue
                 if virtual_facts['virtualization_type'] == 'PR/SM':
                     virtual_facts['virtualization_role'] = 'LPAR'
                 else:
@@ -195,23 +186,30 @@ class LinuxVirtual(Virtual):
 
         # Beware that we can have both kvm and virtualbox running on a single system
         if os.path.exists("/proc/modules") and os.access('/proc/modules', os.R_OK):
-            modules = []
-            for line in get_file_lines("/proc/modules"):
-                data = line.split(" ", 1)
-                modules.append(data[0])
+            # every line starts with a module name followed by a space, so
+            # modules are found with a substring test on the whole file
+            modules = '\n' + (get_file_content('/proc/modules') or '')
 
-            if 'kvm' in modules:
+            if '\nkvm ' in modules:
 
                 if os.path.isdir('/rhev/'):
 
                     # Check whether this is a RHEV hypervisor (is vdsm running ?)
-                    for f in glob.glob('/proc/[0-9]*/comm'):
+                    for pid in os.listdir('/proc'):
+                        if not pid.isdigit():
+                            continue
                         try:
-                            if open(f).read().rstrip() == 'vdsm':
-                                virtual_facts['virtualization_type'] = 'RHEV'
-                                break
+                            comm = open('/proc/%s/comm' % pid, 'rb')
+                            try:
+                                # enough to tell 'vdsm\n' from longer names
+                                is_vdsm = comm.read(8).rstrip() == b'vdsm'
+                            finally:
+                                comm.close()
                         except Exception:
-                            pass
+                            continue
+                        if is_vdsm:
+                            virtual_facts['virtualization_type'] = 'RHEV'
+                            break
                     else:
                         virtual_facts['virtualization_type'] = 'kvm'
 
@@ -220,12 +218,12 @@ class LinuxVirtual(Virtual):
                 virtual_facts['virtualization_role'] = 'host'
                 return virtual_facts
 
-            if 'vboxdrv' in modules:
+            if '\nvboxdrv ' in modules:
                 virtual_facts['virtualization_type'] = 'virtualbox'
                 virtual_facts['virtualization_role'] = 'host'
                 return virtual_facts
 
-            if 'virtio' in modules:
+            if '\nvirtio ' in modules:
                 virtual_facts['virtualization_type'] = 'kvm'
                 virtual_facts['virtualization_role'] = 'guest'
                 return virtual_facts
@@ -80,13 +80,14 @@ def backup(module, running_config):
             os.mkdir(backup_path)
         except:
             module.fail_json(msg="Can't create directory {0} Permission denied ?".format(backup_path))
-    tstamp = time.strftime("%Y-%m-%d@%H:%M:%S", time.localtime(time.time()))
+    tstamp = time.strftime("%Y-%m-%d@%H:%M:%S")
     if 0 < len(backup_filename):
         filename = '%s/%s' % (backup_path, backup_filename)
     else:
         filename = '%s/%s_config.%s' % (backup_path, module.params['host'], tstamp)
     try:
-        open(filename, 'w').write(running_config)
+        with open(filename, 'w') as backup_file:
+            backup_file.write(running_config)
     except:
         module.fail_json(msg="Can't create backup file {0} Permission denied ?".format(filename))
 
@@ -28,7 +28,7 @@ from functools import partial
 from jinja2.exceptions import UndefinedError
 
 from ansible import constants as C
-from ansible.module_utils.six import iteritems, string_types, with_metaclass
+from ansible.module_utils.six import integer_types, iteritems, string_types, with_metaclass
 from ansible.module_utils.parsing.convert_bool import boolean
 from ansible.errors import AnsibleParserError, AnsibleUndefinedVariable
 from ansible.module_utils._text import to_text, to_native
@@ -42,6 +42,9 @@ except ImportError:
     from ansible.utils.display import Display
     display = Display()
 
+# attribute values of these types are shared rather than copied by Base.copy()
+_IMMUTABLE_TYPES = string_types + integer_types + (float, bool, type(None))
+
 
 def _generic_g(prop_name, self):
     try:
@@ -327,7 +330,11 @@ class Base(with_metaclass(BaseMeta, object)):
         new_me = self.__class__()
 
         for name in self._valid_attrs.keys():
-            new_me._attributes[name] = shallowcopy(self._attributes[name])
+            value = self._attributes[name]
+            # immutable values can be shared, only containers need copying
+            if not isinstance(value, _IMMUTABLE_TYPES):
+                value = shallowcopy(value)
+            new_me._attributes[name] = value
 
         new_me._loader = self._loader
         new_me._variable_manager = self._variable_manager
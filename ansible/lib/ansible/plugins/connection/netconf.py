@@ -75,8 +75,9 @@ import json
 
 from ansible import constants as C
 from ansible.errors import AnsibleConnectionFailure, AnsibleError
-from ansible.module_utils._text import to_bytes, to_native, to_text
+from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.parsing.convert_bool import BOOLEANS_TRUE
+from ansible.module_utils.six import iteritems
 from ansible.plugins.loader import netconf_loader
 from ansible.plugins.connection import ConnectionBase, ensure_connect
 from ansible.utils.jsonrpc import Rpc
@@ -85,7 +86,7 @@ try:
     from ncclient import manager
     from ncclient.operations import RPCError
     from ncclient.transport.errors import SSHUnknownHostError
-    from ncclient.xml_ import to_ele, to_xml
+    from ncclient.xml_ import etree, to_xml
 except ImportError:
     raise AnsibleError("ncclient is not installed")
 
@@ -126,39 +127,23 @@ class Connection(Rpc, ConnectionBase):
         if self._play_context.private_key_file:
             self.key_filename = os.path.expanduser(self._play_context.private_key_file)
 
+        ssh_config = os.getenv('ANSIBLE_NETCONF_SSH_CONFIG', False)
+        if ssh_config in BOOLEANS_TRUE:
+            ssh_config = True
+        else:
+            ssh_config = None
+
         network_os = self._play_context.network_os
 
         if not network_os:
-            for cls in netconf_loader.all(class_only=True):
-                network_os = cls.guess_network_os(self)
-                if network_os:
-                    display.display('discovered network_os %s' % network_os, log_only=True)
+            network_os = self._guess_network_os(ssh_config)
+            if network_os:
+                display.display('discovered network_os %s' % network_os, log_only=True)
 
         if not network_os:
             raise AnsibleConnectionFailure('Unable to automatically determine host network os. Please ansible_network_os value')
 
-        ssh_config = os.getenv('ANSIBLE_NETCONF_SSH_CONFIG', False)
-        if ssh_config in BOOLEANS_TRUE:
-            ssh_config = True
-        else:
-            ssh_config = None
-
-        try:
-            self._manager = manager.connect(
-                host=self._play_context.remote_addr,
-                port=self._play_context.port or 830,
-                username=self._play_context.remote_user,
-                password=self._play_context.password,
-                key_filename=str(self.key_filename),
-                hostkey_verify=C.HOST_KEY_CHECKING,
-                look_for_keys=C.PARAMIKO_LOOK_FOR_KEYS,
-                allow_agent=self.allow_agent,
-                timeout=self._play_context.timeout,
-                device_params={'name': network_os},
-                ssh_config=ssh_config
-            )
-        except SSHUnknownHostError as exc:
-            raise AnsibleConnectionFailure(str(exc))
+        self._manager = self._connect_manager(ssh_config, network_os)
 
         if not self._manager.connected:
             return 1, b'', b'not connected'
@@ -176,12 +161,77 @@ class Connection(Rpc, ConnectionBase):
 
         return 0, to_bytes(self._manager.session_id, errors='surrogate_or_strict'), b''
 
+    def _connect_manager(self, ssh_config, network_os=None):
+        """Opens an ncclient session to the remote host, using the device
+        handler for network_os when it is known.
+        """
+        params = dict(
+            host=self._play_context.remote_addr,
+            port=self._play_context.port or 830,
+            username=self._play_context.remote_user,
+            password=self._play_context.password,
+            key_filename=str(self.key_filename),
+            hostkey_verify=C.HOST_KEY_CHECKING,
+            look_for_keys=C.PARAMIKO_LOOK_FOR_KEYS,
+            allow_agent=self.allow_agent,
+            timeout=self._play_context.timeout,
+            ssh_config=ssh_config
+        )
+        if network_os:
+            params['device_params'] = {'name': network_os}
+
+        try:
+            return manager.connect(**params)
+        except SSHUnknownHostError as exc:
+            raise AnsibleConnectionFailure(str(exc))
+
+    def _guess_network_os(self, ssh_config):
+        """Matches the server hello against the capabilities claimed by the
+        netconf plugins using a single probe session, and only asks plugins
+        that do not declare any to guess the network_os themselves.
+        """
+        capabilities = {}
+        guessers = []
+        for cls in netconf_loader.all(class_only=True):
+            if cls.capabilities_match:
+                for match in cls.capabilities_match:
+                    capabilities[match] = cls._load_name
+            else:
+                guessers.append(cls)
+
+        if capabilities:
+            m = self._connect_manager(ssh_config)
+            try:
+                for capability in m.server_capabilities:
+                    for match, network_os in iteritems(capabilities):
+                        if match in capability:
+                            return network_os
+            finally:
+                m.close_session()
+
+        for cls in guessers:
+            network_os = cls.guess_network_os(self)
+            if network_os:
+                return network_os
+
     def close(self):
         if self._manager:
             self._manager.close_session()
             self._connected = False
         super(Connection, self).close()
 
+    def _exec_request(self, obj):
+        """Dispatches a json-rpc (2.0) request decoded by exec_command"""
+        if 'jsonrpc' in obj:
+            if self._netconf:
+                out = self._exec_rpc(obj)
+            else:
+                out = self.internal_error("netconf plugin is not supported for network_os %s" % self._play_context.network_os)
+            return 0, to_bytes(out, errors='surrogate_or_strict'), b''
+        else:
+            err = self.invalid_request(obj)
+            return 1, b'', to_bytes(err, errors='surrogate_or_strict')
+
     @ensure_connect
     def exec_command(self, request):
         """Sends the request to the node and returns the reply
@@ -189,24 +239,24 @@ class Connection(Rpc, ConnectionBase):
         string that represents xml string be send over netconf session.
         The second form is a json-rpc (2.0) byte string.
         """
-        try:
-            obj = json.loads(to_text(request, errors='surrogate_or_strict'))
-
-            if 'jsonrpc' in obj:
-                if self._netconf:
-                    out = self._exec_rpc(obj)
-                else:
-                    out = self.internal_error("netconf plugin is not supported for network_os %s" % self._play_context.network_os)
-                return 0, to_bytes(out, errors='surrogate_or_strict'), b''
+        # json-rpc requests are always json objects, anything not starting
+        # with a brace is handed to the xml parser without a json attempt
+        b_request = to_bytes(request, errors='surrogate_or_strict').lstrip()
+        if b_request.startswith(b'{'):
+            try:
+                obj = json.loads(to_text(b_request, errors='surrogate_or_strict'))
+            except ValueError:
+                pass
             else:
-                err = self.invalid_request(obj)
-                return 1, b'', to_bytes(err, errors='surrogate_or_strict')
+                return self._exec_request(obj)
 
-        except (ValueError, TypeError):
-            # to_ele operates on native strings
-            request = to_native(request, errors='surrogate_or_strict')
+        # parse the bytes directly with lxml rather than going through
+        # to_ele, which needs a native string and encodes it back to bytes
+        try:
+            req = etree.fromstring(b_request)
+        except etree.XMLSyntaxError:
+            req = None
 
-        req = to_ele(request)
         if req is None:
             return 1, b'', b'unable to parse request'
 
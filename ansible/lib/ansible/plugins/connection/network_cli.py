@@ -59,6 +59,7 @@ from ansible.module_utils.six import BytesIO, binary_type
 from ansible.module_utils._text import to_bytes, to_text
 from ansible.plugins.loader import cliconf_loader, terminal_loader
 from ansible.plugins.connection.paramiko_ssh import Connection as _Connection
+from ansible.plugins.terminal import merge_regex
 from ansible.utils.jsonrpc import Rpc
 
 try:
@@ -203,6 +204,8 @@ class Connection(Rpc, _Connection):
 
     def _strip(self, data):
         """Removes ANSI codes from device response"""
+        # applied one at a time in list order, a single alternation would
+        # let one expression eat the start of another's match
         for regex in self._terminal.ansi_re:
             data = regex.sub(b'', data)
         return data
@@ -238,7 +241,7 @@ class Connection(Rpc, _Connection):
         """Searches the buffered response for a matching command prompt"""
         errored_response = None
         is_error_message = False
-        for regex in self._terminal.terminal_stderr_re:
+        for regex in merge_regex(self._terminal.terminal_stderr_re):
             if regex.search(response):
                 is_error_message = True
 
@@ -250,6 +253,7 @@ class Connection(Rpc, _Connection):
                         errored_response = response
                         self._matched_prompt = match.group()
                         break
+                break
 
         if not is_error_message:
             for regex in self._terminal.terminal_stdout_re:
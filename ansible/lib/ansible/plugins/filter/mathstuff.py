@@ -34,9 +34,18 @@ def unique(a):
         c = set(a)
     else:
         c = []
-        for x in a:
-            if x not in c:
-                c.append(x)
+        try:
+            # keep first-seen order, using a set for membership when the items allow it
+            seen = set()
+            for x in a:
+                if x not in seen:
+                    seen.add(x)
+                    c.append(x)
+        except TypeError:
+            c = []
+            for x in a:
+                if x not in c:
+                    c.append(x)
     return c
 
 
@@ -44,7 +53,11 @@ def intersect(a, b):
     if isinstance(a, collections.Hashable) and isinstance(b, collections.Hashable):
         c = set(a) & set(b)
     else:
-        c = unique([x for x in a if x in b])
+        try:
+            b_set = set(b)
+            c = unique([x for x in a if x in b_set])
+        except TypeError:
+            c = unique([x for x in a if x in b])
     return c
 
 
@@ -52,7 +65,11 @@ def difference(a, b):
     if isinstance(a, collections.Hashable) and isinstance(b, collections.Hashable):
         c = set(a) - set(b)
     else:
-        c = unique([x for x in a if x not in b])
+        try:
+            b_set = set(b)
+            c = unique([x for x in a if x not in b_set])
+        except TypeError:
+            c = unique([x for x in a if x not in b])
     return c
 
 
@@ -60,7 +77,8 @@ def symmetric_difference(a, b):
     if isinstance(a, collections.Hashable) and isinstance(b, collections.Hashable):
         c = set(a) ^ set(b)
     else:
-        c = unique([x for x in union(a, b) if x not in intersect(a, b)])
+        isect = intersect(a, b)
+        c = unique([x for x in union(a, b) if x not in isect])
     return c
 
 
@@ -39,6 +39,14 @@ except ImportError:
 
 _SAFE_GROUP = re.compile("[^A-Za-z0-9\_]")
 
+# keyed groups produce the same few names for many hosts, remember the
+# converted names so each distinct one is only scanned once
+_SAFE_GROUP_CACHE = {}
+_SAFE_GROUP_CACHE_SIZE = 4096
+
+# plugin NAME -> first hex digits of its sha1, see get_cache_prefix
+_CACHE_PREFIX_NAMES = {}
+
 
 class BaseInventoryPlugin(object):
     """ Parses an Inventory Source"""
@@ -48,15 +56,29 @@ class BaseInventoryPlugin(object):
     def __init__(self, cache=None):
 
         self.inventory = None
+        self.loader = None
         self.display = display
         self.cache = cache or {}
+        self._templar = None
 
     def parse(self, inventory, loader, path, cache=True):
         ''' Populates self.groups from the given data. Raises an error on any parse failure.  '''
 
         self.loader = loader
         self.inventory = inventory
-        self.templar = Templar(loader=loader)
+        self._templar = None
+
+    @property
+    def templar(self):
+        ''' Templar for this plugin's loader, only created when first needed '''
+
+        if self._templar is None:
+            self._templar = Templar(loader=self.loader)
+        return self._templar
+
+    @templar.setter
+    def templar(self, templar):
+        self._templar = templar
 
     def verify_file(self, path):
         ''' Verify if file is usable by this plugin, base does minimal accessability check '''
@@ -67,15 +89,14 @@ class BaseInventoryPlugin(object):
     def get_cache_prefix(self, path):
         ''' create predictable unique prefix for plugin/inventory '''
 
-        m = hashlib.sha1()
-        m.update(to_bytes(self.NAME, errors='surrogate_or_strict'))
-        d1 = m.hexdigest()
+        # the plugin half only depends on the plugin name, hash it once
+        d1 = _CACHE_PREFIX_NAMES.get(self.NAME)
+        if d1 is None:
+            d1 = _CACHE_PREFIX_NAMES[self.NAME] = hashlib.sha1(to_bytes(self.NAME, errors='surrogate_or_strict')).hexdigest()[:5]
 
-        n = hashlib.sha1()
-        n.update(to_bytes(path, errors='surrogate_or_strict'))
-        d2 = n.hexdigest()
+        d2 = hashlib.sha1(to_bytes(path, errors='surrogate_or_strict')).hexdigest()
 
-        return 's_'.join([d1[:5], d2[:5]])
+        return 's_'.join([d1, d2[:5]])
 
     def clear_cache(self):
         pass
@@ -86,8 +107,7 @@ class BaseInventoryPlugin(object):
 
         for host in hosts:
             self.inventory.add_host(host, group=group, port=port)
-            for k in variables:
-                self.inventory.set_variable(host, k, variables[k])
+            self.inventory.set_variables(host, variables)
 
     def _compose(self, template, variables):
         ''' helper method for pluigns to compose variables for Ansible based on jinja2 expression and inventory vars'''
@@ -129,13 +149,18 @@ class BaseInventoryPlugin(object):
     def _add_host_to_keyed_groups(self, keys, variables, host, strict=False):
         ''' helper to create groups for plugins based on variable values and add the corresponding hosts to it'''
         if keys and isinstance(keys, list):
+            # these are looked up for every key of every host, keep them local
+            compose = self._compose
+            inventory_groups = self.inventory.groups
+            add_group = self.inventory.add_group
+            add_child = self.inventory.add_child
             for keyed in keys:
                 if keyed and isinstance(keyed, dict):
                     prefix = keyed.get('prefix', '')
                     key = keyed.get('key')
                     if key is not None:
                         try:
-                            groups = to_safe_group_name('%s_%s' % (prefix, self._compose(key, variables)))
+                            groups = to_safe_group_name('%s_%s' % (prefix, compose(key, variables)))
                         except Exception as e:
                             if strict:
                                 raise AnsibleOptionsError("Could not generate group on %s: %s" % (key, to_native(e)))
@@ -144,9 +169,9 @@ class BaseInventoryPlugin(object):
                             groups = [groups]
                         if isinstance(groups, list):
                             for group_name in groups:
-                                if group_name not in self.inventory.groups:
-                                    self.inventory.add_group(group_name)
-                                self.inventory.add_child(group_name, host)
+                                if group_name not in inventory_groups:
+                                    add_group(group_name)
+                                add_child(group_name, host)
                         else:
                             raise AnsibleOptionsError("Invalid group name format, expected string or list of strings, got: %s" % type(groups))
                     else:
@@ -169,7 +194,13 @@ class BaseFileInventoryPlugin(BaseInventoryPlugin):
 # Helper methods
 def to_safe_group_name(name):
     ''' Converts 'bad' characters in a string to underscores so they can be used as Ansible hosts or groups '''
-    return _SAFE_GROUP.sub("_", name)
+    try:
+        return _SAFE_GROUP_CACHE[name]
+    except KeyError:
+        if len(_SAFE_GROUP_CACHE) >= _SAFE_GROUP_CACHE_SIZE:
+            _SAFE_GROUP_CACHE.clear()
+        safe_name = _SAFE_GROUP_CACHE[name] = _SAFE_GROUP.sub("_", name)
+        return safe_name
 
 
 def detect_range(line=None):
@@ -246,7 +277,8 @@ def expand_hostname_range(line=None):
         for rseq in seq:
             hname = ''.join((head, fill(rseq), tail))
 
-            if detect_range(hname):
+            # same check as detect_range, inlined as it runs for every generated name
+            if '[' in hname:
                 all_hosts.extend(expand_hostname_range(hname))
             else:
                 all_hosts.append(hname)
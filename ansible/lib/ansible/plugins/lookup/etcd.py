@@ -69,6 +69,8 @@ RETURN = '''
 
 import os
 
+from multiprocessing.pool import ThreadPool
+
 try:
     import json
 except ImportError:
@@ -86,6 +88,9 @@ ANSIBLE_ETCD_VERSION = 'v1'
 if os.getenv('ANSIBLE_ETCD_VERSION') is not None:
     ANSIBLE_ETCD_VERSION = os.environ['ANSIBLE_ETCD_VERSION']
 
+# upper bound on keys fetched concurrently in a single lookup
+ANSIBLE_ETCD_MAX_WORKERS = 8
+
 
 class Etcd:
     def __init__(self, url=ANSIBLE_ETCD_URL, version=ANSIBLE_ETCD_VERSION,
@@ -152,9 +157,15 @@ class LookupModule(LookupBase):
 
         etcd = Etcd(validate_certs=validate_certs)
 
-        ret = []
-        for term in terms:
-            key = term.split()[0]
-            value = etcd.get(key)
-            ret.append(value)
-        return ret
+        keys = [term.split()[0] for term in terms]
+        if len(keys) < 2:
+            return [etcd.get(key) for key in keys]
+
+        # fetch the keys concurrently so parsing one response overlaps
+        # with waiting on the others, map() keeps the terms order
+        pool = ThreadPool(min(len(keys), ANSIBLE_ETCD_MAX_WORKERS))
+        try:
+            return pool.map(etcd.get, keys)
+        finally:
+            pool.close()
+            pool.join()
@@ -83,6 +83,10 @@ class NetconfBase(with_metaclass(ABCMeta, object)):
             conn.load_configuration(config=[''set system ntp server 1.1.1.1''], action='set', format='text')
     """
 
+    # substrings of the server hello capabilities that identify this
+    # network_os, lets the connection guess it from one shared probe session
+    capabilities_match = ()
+
     def __init__(self, connection):
         self._connection = connection
         self.m = self._connection._manager
@@ -35,7 +35,7 @@ from ansible.executor.process.worker import WorkerProcess
 from ansible.executor.task_result import TaskResult
 from ansible.inventory.host import Host
 from ansible.module_utils.six.moves import queue as Queue
-from ansible.module_utils.six import iteritems, string_types
+from ansible.module_utils.six import iteritems, itervalues, string_types
 from ansible.module_utils._text import to_text
 from ansible.playbook.helpers import load_list_of_blocks
 from ansible.playbook.included_file import IncludedFile
@@ -56,18 +56,27 @@ except ImportError:
 __all__ = ['StrategyBase']
 
 
-class StrategySentinel:
-    pass
+class StrategySentinel(object):
+    __slots__ = ()
+
+    def __reduce__(self):
+        # the sentinel travels through the (pickling) final queue, make it
+        # unpickle to the module level instance so it can be compared by
+        # identity on the receiving end
+        return '_sentinel'
 
 
 # TODO: this should probably be in the plugins/__init__.py, with
 #       a smarter mechanism to set all of the attributes based on
 #       the loaders created there
-class SharedPluginLoaderObj:
+class SharedPluginLoaderObj(object):
     '''
     A simple object to make pass the various plugin loaders to
     the forked processes over the queue easier
     '''
+    __slots__ = ('action_loader', 'connection_loader', 'filter_loader',
+                 'test_loader', 'lookup_loader', 'module_loader')
+
     def __init__(self):
         self.action_loader = action_loader
         self.connection_loader = connection_loader
@@ -80,37 +89,40 @@ _sentinel = StrategySentinel()
 
 
 def results_thread_main(strategy):
+    # all workers report through the one final queue: results are pickled in
+    # the workers' own feeder threads and unpickled by this single consumer
+    # either way, and waiting on per-worker pipes would need
+    # multiprocessing.connection.wait(), which python2 does not have.
+    # bound once, this loop runs for every result of the play
+    get_result = strategy._final_q.get
+    add_result = strategy._results.append
+    results_ready = strategy._results_ready.set
     while True:
         try:
-            result = strategy._final_q.get()
-            if isinstance(result, StrategySentinel):
-                break
-            else:
-                strategy._results_lock.acquire()
-                strategy._results.append(result)
-                strategy._results_lock.release()
+            result = get_result()
+            # results tend to arrive in bursts, hand over everything that is
+            # already queued before blocking (and giving up the GIL) again
+            while result is not _sentinel:
+                # deque.append is atomic, no lock needed with a single consumer
+                add_result(result)
+                result = get_result(False)
+            break
         except (IOError, EOFError):
             break
         except Queue.Empty:
-            pass
+            # the burst is handed over, wake up _wait_on_pending_results
+            results_ready()
 
 
 def debug_closure(func):
     """
     A stub reimplementation of the debug_closure used in devel, required
     for a later fix that built on top of the work done to move debugging
-    into StrategyBase.
+    into StrategyBase. It is only applied when debugging is enabled.
     """
     @functools.wraps(func)
     def inner(self, iterator, one_pass=False, max_passes=None):
-        _processed_results = []
-        results = func(self, iterator, one_pass=one_pass, max_passes=max_passes)
-        for result in results:
-            task = result._task
-            host = result._host
-            _queued_task_args = self._queued_task_cache.pop((host.name, task._uuid), None)
-            _processed_results.append(result)
-        return _processed_results
+        return list(func(self, iterator, one_pass=one_pass, max_passes=max_passes))
     return inner
 
 
@@ -136,8 +148,44 @@ class StrategyBase:
         # the task cache is a dictionary of tuples of (host.name, task._uuid)
         # used to find the original task object of in-flight tasks and to store
         # the task args/vars and play context info used to queue the task.
+        # Results come back from the worker processes carrying only the host
+        # name and task uuid, so object ids cannot be used as keys here.
         self._queued_task_cache = {}
 
+        # a dummy object with plugin loaders set as an easier way to share
+        # them with the forked processes, the loaders never change so one
+        # instance serves every queued task
+        self._shared_loader_obj = SharedPluginLoaderObj()
+
+        # handlers found by notify name, keyed by (play._uuid, handler_name)
+        self._handler_name_cache = {}
+
+        # notify name -> uuids of the handlers whose include parents match
+        # that name, only valid for the (play._uuid, number of handlers)
+        # stored in _parent_name_index_key
+        self._parent_name_index = {}
+        self._parent_name_index_key = None
+
+        # templar used for handler names, created on first use
+        self._handler_templar = None
+
+        # hosts created for delegated hosts not found in inventory, by name
+        self._synthetic_hosts = {}
+
+        # role objects from the play's ROLE_CACHE, by role _uuid
+        self._roles_by_uuid = {}
+
+        # action name -> whether its action plugin has BYPASS_HOST_LOOP set
+        self._action_bypass_cache = {}
+
+        # set when results added hosts or groups to the inventory, which then
+        # needs to be reconciled
+        self._inventory_dirty = False
+
+        # sets mirroring the host lists in _notified_handlers, so checking
+        # whether a host was already notified does not scan the list
+        self._notified_hosts = {}
+
         # Backwards compat: self._display isn't really needed, just import the global display and use that.
         self._display = display
 
@@ -145,12 +193,22 @@ class StrategyBase:
         self._pending_results = 0
         self._cur_worker = 0
 
+        # worker slots whose task already sent its final result, these are
+        # tried before scanning the whole pool for a free slot
+        self._free_workers = deque()
+
         # this dictionary is used to keep track of hosts that have
-        # outstanding tasks still in queue
+        # outstanding tasks still in queue, it is updated together with
+        # _pending_results when a task is queued and when its result is read
         self._blocked_hosts = dict()
 
+        # filled by the results thread, drained by _process_pending_results;
+        # deque append/popleft are atomic so this needs no extra locking
         self._results = deque()
-        self._results_lock = threading.Condition(threading.Lock())
+
+        # set by the results thread after it handed over results, so waiting
+        # on them does not have to sleep for a fixed interval
+        self._results_ready = threading.Event()
 
         # create the result processing thread for reading results in the background
         self._results_thread = threading.Thread(target=results_thread_main, args=(self,))
@@ -166,12 +224,15 @@ class StrategyBase:
         # make sure that all of the hosts are advanced to their final task.
         # This should be safe, as everything should be ITERATING_COMPLETE by
         # this point, though the strategy may not advance the hosts itself.
-        [iterator.get_next_task_for_host(host) for host in self._inventory.get_hosts(iterator._play.hosts) if host.name not in self._tqm._unreachable_hosts]
+        unreachable = self._tqm._unreachable_hosts
+        for host in self._inventory.get_hosts(iterator._play.hosts):
+            if host.name not in unreachable:
+                iterator.get_next_task_for_host(host)
 
         # save the failed/unreachable hosts, as the run_handlers()
         # method will clear that information during its execution
-        failed_hosts = iterator.get_failed_hosts()
-        unreachable_hosts = self._tqm._unreachable_hosts.keys()
+        failed_hosts = set(iterator.get_failed_hosts())
+        unreachable_hosts = set(unreachable)
 
         display.debug("running handlers")
         handler_result = self.run_handlers(iterator, play_context)
@@ -182,8 +243,8 @@ class StrategyBase:
 
         # now update with the hosts (if any) that failed or were
         # unreachable during the handler execution phase
-        failed_hosts = set(failed_hosts).union(iterator.get_failed_hosts())
-        unreachable_hosts = set(unreachable_hosts).union(self._tqm._unreachable_hosts.keys())
+        failed_hosts.update(iterator.get_failed_hosts())
+        unreachable_hosts.update(self._tqm._unreachable_hosts)
 
         # return the appropriate code, depending on the status hosts after the run
         if not isinstance(result, bool) and result != self._tqm.RUN_OK:
@@ -196,11 +257,14 @@ class StrategyBase:
             return self._tqm.RUN_OK
 
     def get_hosts_remaining(self, play):
+        failed = self._tqm._failed_hosts
+        unreachable = self._tqm._unreachable_hosts
         return [host for host in self._inventory.get_hosts(play.hosts)
-                if host.name not in self._tqm._failed_hosts and host.name not in self._tqm._unreachable_hosts]
+                if host.name not in failed and host.name not in unreachable]
 
     def get_failed_hosts(self, play):
-        return [host for host in self._inventory.get_hosts(play.hosts) if host.name in self._tqm._failed_hosts]
+        failed = self._tqm._failed_hosts
+        return [host for host in self._inventory.get_hosts(play.hosts) if host.name in failed]
 
     def add_tqm_variables(self, vars, play):
         '''
@@ -233,36 +297,47 @@ class StrategyBase:
         # and then queue the new task
         try:
 
-            # create a dummy object with plugin loaders set as an easier
-            # way to share them with the forked processes
-            shared_loader_obj = SharedPluginLoaderObj()
+            shared_loader_obj = self._shared_loader_obj
 
-            queued = False
+            workers = self._workers
+            worker_id = None
+            while self._free_workers and worker_id is None:
+                candidate = self._free_workers.popleft()
+                worker_prc = workers[candidate][0]
+                if worker_prc is None or not worker_prc.is_alive():
+                    worker_id = candidate
+
+            # tasks are only ever queued from the main thread, so a single
+            # cursor over the whole pool is enough; splitting the pool per
+            # host would leave a host waiting on its own slots while others
+            # are idle
+            num_workers = len(workers)
             starting_worker = self._cur_worker
-            while True:
-                (worker_prc, rslt_q) = self._workers[self._cur_worker]
+            while worker_id is None:
+                (worker_prc, rslt_q) = workers[self._cur_worker]
                 if worker_prc is None or not worker_prc.is_alive():
-                    self._queued_task_cache[(host.name, task._uuid)] = {
-                        'host': host,
-                        'task': task,
-                        'task_vars': task_vars,
-                        'play_context': play_context
-                    }
-
-                    worker_prc = WorkerProcess(self._final_q, task_vars, host, task, play_context, self._loader, self._variable_manager, shared_loader_obj)
-                    self._workers[self._cur_worker][0] = worker_prc
-                    worker_prc.start()
-                    display.debug("worker is %d (out of %d available)" % (self._cur_worker + 1, len(self._workers)))
-                    queued = True
+                    worker_id = self._cur_worker
                 self._cur_worker += 1
-                if self._cur_worker >= len(self._workers):
+                if self._cur_worker >= num_workers:
                     self._cur_worker = 0
-                if queued:
-                    break
-                elif self._cur_worker == starting_worker:
+                if worker_id is None and self._cur_worker == starting_worker:
                     time.sleep(0.0001)
 
+            self._queued_task_cache[(host.name, task._uuid)] = {
+                'host': host,
+                'task': task,
+                'task_vars': task_vars,
+                'play_context': play_context,
+                'worker_id': worker_id,
+            }
+
+            worker_prc = WorkerProcess(self._final_q, task_vars, host, task, play_context, self._loader, self._variable_manager, shared_loader_obj)
+            workers[worker_id][0] = worker_prc
+            worker_prc.start()
+            display.debug("worker is %d (out of %d available)" % (worker_id + 1, len(workers)))
+
             self._pending_results += 1
+            self._blocked_hosts[host.name] = True
         except (EOFError, IOError, AssertionError) as e:
             # most likely an abort
             display.debug("got an error while queuing: %s" % e)
@@ -281,13 +356,40 @@ class StrategyBase:
         if host_name is not None:
             actual_host = self._inventory.get_host(host_name)
             if actual_host is None:
-                actual_host = Host(name=host_name)
+                actual_host = self._get_synthetic_host(host_name)
         else:
-            actual_host = Host(name=task.delegate_to)
+            actual_host = self._get_synthetic_host(task.delegate_to)
 
         return [actual_host]
 
-    @debug_closure
+    def _get_synthetic_host(self, host_name):
+        '''
+        Returns a Host for a delegated host which is not in inventory. These
+        are only used to key facts by name, so one is kept per name.
+        '''
+        if host_name not in self._synthetic_hosts:
+            self._synthetic_hosts[host_name] = Host(name=host_name)
+        return self._synthetic_hosts[host_name]
+
+    def _action_bypasses_host_loop(self, action_name):
+        '''
+        Returns whether the action plugin for the given action sets
+        BYPASS_HOST_LOOP. The plugin is looked up once per action name.
+        '''
+        try:
+            return self._action_bypass_cache[action_name]
+        except KeyError:
+            pass
+
+        try:
+            action = action_loader.get(action_name, class_only=True)
+        except KeyError:
+            # we don't care here, because the action may simply not have a
+            # corresponding action plugin
+            action = None
+        bypass = self._action_bypass_cache[action_name] = bool(action and getattr(action, 'BYPASS_HOST_LOOP', False))
+        return bypass
+
     def _process_pending_results(self, iterator, one_pass=False, max_passes=None):
         '''
         Reads results off the final queue and takes appropriate action
@@ -296,20 +398,49 @@ class StrategyBase:
 
         ret_results = []
 
+        # cache entries of the final results returned from this call, which
+        # are dropped from the queued task cache in one go at the end
+        finished_entries = []
+
+        # host name as sent by the worker -> inventory host object
+        original_hosts = {}
+
         def get_original_host(host_name):
+            if host_name in original_hosts:
+                return original_hosts[host_name]
+
             # FIXME: this should not need x2 _inventory
-            host_name = to_text(host_name)
-            if host_name in self._inventory.hosts:
-                return self._inventory.hosts[host_name]
+            text_name = to_text(host_name)
+            if text_name in self._inventory.hosts:
+                host = self._inventory.hosts[text_name]
             else:
-                return self._inventory.get_host(host_name)
+                host = self._inventory.get_host(text_name)
+            original_hosts[host_name] = host
+            return host
 
         def search_handler_blocks_by_name(handler_name, handler_blocks):
+            # handler names are templated without host vars, so a match found
+            # once stays valid for the rest of the play. Misses are not cached
+            # as includes can still add handlers.
+            cache_key = (iterator._play._uuid, handler_name)
+            if cache_key in self._handler_name_cache:
+                return self._handler_name_cache[cache_key]
+
+            # the templar's own check for {{, {% and {# markers
+            is_template = self._get_handler_templar()._contains_vars
             for handler_block in handler_blocks:
                 for handler_task in handler_block.block:
                     if handler_task.name:
+                        # names without templating can be compared as they are
+                        if not is_template(handler_task.name):
+                            full_name = handler_task.get_name()
+                            if handler_name in (handler_task.name, full_name):
+                                self._handler_name_cache[cache_key] = handler_task
+                                return handler_task
+                            elif not is_template(full_name):
+                                continue
                         handler_vars = self._variable_manager.get_vars(play=iterator._play, task=handler_task)
-                        templar = Templar(loader=self._loader, variables=handler_vars)
+                        templar = self._get_handler_templar(handler_vars)
                         try:
                             # first we check with the full result of get_name(), which may
                             # include the role name (if the handler is from a role). If that
@@ -317,10 +448,12 @@ class StrategyBase:
                             # have anything extra added to it.
                             target_handler_name = templar.template(handler_task.name)
                             if target_handler_name == handler_name:
+                                self._handler_name_cache[cache_key] = handler_task
                                 return handler_task
                             else:
                                 target_handler_name = templar.template(handler_task.get_name())
                                 if target_handler_name == handler_name:
+                                    self._handler_name_cache[cache_key] = handler_task
                                     return handler_task
                         except (UndefinedError, AnsibleUndefinedVariable):
                             # We skip this handler due to the fact that it may be using
@@ -330,19 +463,55 @@ class StrategyBase:
                             continue
             return None
 
+        # handlers do not change while results are processed, so index them
+        # by uuid on first use instead of scanning the blocks per lookup
+        handlers_by_uuid = {}
+
         def search_handler_blocks_by_uuid(handler_uuid, handler_blocks):
-            for handler_block in handler_blocks:
-                for handler_task in handler_block.block:
-                    if handler_uuid == handler_task._uuid:
-                        return handler_task
-            return None
+            if not handlers_by_uuid:
+                for handler_block in handler_blocks:
+                    for handler_task in handler_block.block:
+                        handlers_by_uuid.setdefault(handler_task._uuid, handler_task)
+            return handlers_by_uuid.get(handler_uuid)
+
+        # (id(target_handler), handler_name) -> result of parent_handler_match
+        parent_handler_matches = {}
 
         def parent_handler_match(target_handler, handler_name):
+            cache_key = (id(target_handler), handler_name)
+            if cache_key not in parent_handler_matches:
+                parent_handler_matches[cache_key] = _parent_handler_match(target_handler, handler_name)
+            return parent_handler_matches[cache_key]
+
+        def search_handlers_by_parent_name(handler_name):
+            # like the handler names, parent names are templated without host
+            # vars; the index is rebuilt if handlers were added to the play
+            index_key = (iterator._play._uuid, len(self._notified_handlers))
+            if self._parent_name_index_key != index_key:
+                self._parent_name_index = {}
+                self._parent_name_index_key = index_key
+            if handler_name not in self._parent_name_index:
+                matches = []
+                for target_handler_uuid in self._notified_handlers:
+                    target_handler = search_handler_blocks_by_uuid(target_handler_uuid, iterator._play.handlers)
+                    if target_handler and parent_handler_match(target_handler, handler_name):
+                        matches.append(target_handler)
+                self._parent_name_index[handler_name] = matches
+            return self._parent_name_index[handler_name]
+
+        def _parent_handler_match(target_handler, handler_name):
             if target_handler:
                 if isinstance(target_handler, (TaskInclude, IncludeRole)):
+                    full_name = target_handler.get_name()
+                    is_template = self._get_handler_templar()._contains_vars
+                    if not is_template(target_handler.name) and not is_template(full_name):
+                        # nothing to template, compare the names as they are
+                        if handler_name in (target_handler.name, full_name):
+                            return True
+                        return parent_handler_match(target_handler._parent, handler_name)
                     try:
                         handler_vars = self._variable_manager.get_vars(play=iterator._play, task=target_handler)
-                        templar = Templar(loader=self._loader, variables=handler_vars)
+                        templar = self._get_handler_templar(handler_vars)
                         target_handler_name = templar.template(target_handler.name)
                         if target_handler_name == handler_name:
                             return True
@@ -357,19 +526,26 @@ class StrategyBase:
                 return False
 
         cur_pass = 0
+        batch = deque()
         while True:
-            try:
-                self._results_lock.acquire()
-                task_result = self._results.popleft()
-            except IndexError:
-                break
-            finally:
-                self._results_lock.release()
+            if not batch:
+                # take everything queued so far in one go, but never more than
+                # the passes left so nothing is dequeued without being processed
+                if one_pass:
+                    batch = self._drain_results(1)
+                elif max_passes is not None:
+                    batch = self._drain_results(max_passes - cur_pass)
+                else:
+                    batch = self._drain_results()
+                if not batch:
+                    break
+            task_result = batch.popleft()
 
             # get the original host and task. We then assign them to the TaskResult for use in callbacks/etc.
             original_host = get_original_host(task_result._host)
             queue_cache_entry = (original_host.name, task_result._task)
-            found_task = self._queued_task_cache.get(queue_cache_entry)['task']
+            queued_task = self._queued_task_cache.get(queue_cache_entry)
+            found_task = queued_task['task']
             original_task = found_task.copy(exclude_parent=True, exclude_tasks=True)
             original_task._parent = found_task._parent
             original_task.from_attrs(task_result._task_fields)
@@ -403,8 +579,7 @@ class StrategyBase:
                 host_list = self.get_task_hosts(iterator, original_host, original_task)
 
                 clean_copy = strip_internal_keys(task_result._result)
-                if 'invocation' in clean_copy:
-                    del clean_copy['invocation']
+                clean_copy.pop('invocation', None)
 
                 for target_host in host_list:
                     self._variable_manager.set_nonpersistent_facts(target_host, {original_task.register: clean_copy})
@@ -418,11 +593,10 @@ class StrategyBase:
                     display.debug("marking %s as failed" % original_host.name)
                     if original_task.run_once:
                         # if we're using run_once, we have to fail every host here
+                        unreachable_hosts = self._tqm._unreachable_hosts
                         for h in self._inventory.get_hosts(iterator._play.hosts):
-                            if h.name not in self._tqm._unreachable_hosts:
-                                state, _ = iterator.get_next_task_for_host(h, peek=True)
+                            if h.name not in unreachable_hosts:
                                 iterator.mark_host_failed(h)
-                                state, new_task = iterator.get_next_task_for_host(h, peek=True)
                     else:
                         iterator.mark_host_failed(original_host)
 
@@ -484,22 +658,16 @@ class StrategyBase:
                                 target_handler = search_handler_blocks_by_name(handler_name, iterator._play.handlers)
                                 if target_handler is not None:
                                     found = True
-                                    if target_handler._uuid not in self._notified_handlers:
-                                        self._notified_handlers[target_handler._uuid] = []
-                                    if original_host not in self._notified_handlers[target_handler._uuid]:
-                                        self._notified_handlers[target_handler._uuid].append(original_host)
+                                    if self._notify_host(target_handler._uuid, original_host):
                                         # FIXME: should this be a callback?
                                         display.vv("NOTIFIED HANDLER %s" % (handler_name,))
                                 else:
                                     # As there may be more than one handler with the notified name as the
                                     # parent, so we just keep track of whether or not we found one at all
-                                    for target_handler_uuid in self._notified_handlers:
-                                        target_handler = search_handler_blocks_by_uuid(target_handler_uuid, iterator._play.handlers)
-                                        if target_handler and parent_handler_match(target_handler, handler_name):
-                                            found = True
-                                            if original_host not in self._notified_handlers[target_handler._uuid]:
-                                                self._notified_handlers[target_handler._uuid].append(original_host)
-                                                display.vv("NOTIFIED HANDLER %s" % (target_handler.get_name(),))
+                                    for target_handler in search_handlers_by_parent_name(handler_name):
+                                        found = True
+                                        if self._notify_host(target_handler._uuid, original_host):
+                                            display.vv("NOTIFIED HANDLER %s" % (target_handler.get_name(),))
 
                                 if handler_name in self._listening_handlers:
                                     for listening_handler_uuid in self._listening_handlers[handler_name]:
@@ -508,8 +676,7 @@ class StrategyBase:
                                             found = True
                                         else:
                                             continue
-                                        if original_host not in self._notified_handlers[listening_handler._uuid]:
-                                            self._notified_handlers[listening_handler._uuid].append(original_host)
+                                        if self._notify_host(listening_handler._uuid, original_host):
                                             display.vv("NOTIFIED HANDLER %s" % (listening_handler.get_name(),))
 
                                 # and if none were found, then we raise an error
@@ -546,12 +713,15 @@ class StrategyBase:
                                     self._variable_manager.set_host_variable(target_host, var_name, var_value)
                         else:
                             cacheable = result_item.pop('ansible_facts_cacheable', True)
+                            # each cache (and host) gets its own copy: the caches keep
+                            # the dict they are given and update it in place later on
+                            facts = result_item['ansible_facts']
                             for target_host in host_list:
                                 if cacheable:
-                                    self._variable_manager.set_host_facts(target_host, result_item['ansible_facts'].copy())
+                                    self._variable_manager.set_host_facts(target_host, facts.copy())
 
                                 # If we are setting a fact, it should populate non_persistent_facts as well
-                                self._variable_manager.set_nonpersistent_facts(target_host, result_item['ansible_facts'].copy())
+                                self._variable_manager.set_nonpersistent_facts(target_host, facts.copy())
 
                     if 'ansible_stats' in result_item and 'data' in result_item['ansible_stats'] and result_item['ansible_stats']['data']:
 
@@ -582,45 +752,134 @@ class StrategyBase:
                 self._tqm.send_callback('v2_runner_on_ok', task_result)
 
             self._pending_results -= 1
-            if original_host.name in self._blocked_hosts:
-                del self._blocked_hosts[original_host.name]
+            self._blocked_hosts.pop(original_host.name, None)
+
+            # this was the final result for the task, its worker is done
+            if queued_task.get('worker_id') is not None:
+                self._free_workers.append(queued_task['worker_id'])
 
             # If this is a role task, mark the parent role as being run (if
             # the task was ok or failed, but not skipped or unreachable)
             if original_task._role is not None and role_ran:  # TODO:  and original_task.action != 'include_role':?
                 # lookup the role in the ROLE_CACHE to make sure we're dealing
                 # with the correct object and mark it as executed
-                for (entry, role_obj) in iteritems(iterator._play.ROLE_CACHE[original_task._role._role_name]):
-                    if role_obj._uuid == original_task._role._uuid:
-                        role_obj._had_task_run[original_host.name] = True
+                role_obj = self._get_cached_role(iterator._play, original_task._role)
+                if role_obj is not None:
+                    role_obj._had_task_run[original_host.name] = True
 
             ret_results.append(task_result)
+            finished_entries.append(queue_cache_entry)
 
             if one_pass or max_passes is not None and (cur_pass + 1) >= max_passes:
                 break
 
             cur_pass += 1
 
+        pop_queued_task = self._queued_task_cache.pop
+        for entry in finished_entries:
+            pop_queued_task(entry, None)
+
+        if self._inventory_dirty:
+            # reconcile inventory, ensures inventory rules are followed after
+            # hosts or groups were added by any of the results above
+            self._inventory.reconcile_inventory()
+            self._variable_manager.invalidate_hostvars()
+            self._inventory_dirty = False
+
         return ret_results
 
+    if C.DEFAULT_DEBUG:
+        _process_pending_results = debug_closure(_process_pending_results)
+
+    def _notify_host(self, handler_uuid, host):
+        '''
+        Adds host to the hosts notified for the given handler, keeping the
+        notification order. Returns False if it had already been notified.
+        '''
+        notified = self._notified_handlers.setdefault(handler_uuid, [])
+        index = self._notified_hosts.get(handler_uuid)
+        if index is None or len(index) != len(notified):
+            # the list was reset or replaced elsewhere, resync the set
+            index = self._notified_hosts[handler_uuid] = set(notified)
+
+        if host in index:
+            return False
+
+        notified.append(host)
+        index.add(host)
+        return True
+
+    def _get_cached_role(self, play, role):
+        '''
+        Returns the role object in the play's ROLE_CACHE with the same _uuid
+        as the given role, or None. The cache entries for the role name are
+        indexed by _uuid the first time one of them is not found.
+        '''
+        role_obj = self._roles_by_uuid.get(role._uuid)
+        if role_obj is None:
+            for role_obj in itervalues(play.ROLE_CACHE[role._role_name]):
+                self._roles_by_uuid[role_obj._uuid] = role_obj
+            role_obj = self._roles_by_uuid.get(role._uuid)
+        return role_obj
+
+    def _get_handler_templar(self, variables=None):
+        '''
+        Returns the templar shared by the handler name lookups, with its
+        available variables set to the given ones if any are passed.
+        '''
+        if self._handler_templar is None:
+            self._handler_templar = Templar(loader=self._loader)
+        if variables is not None:
+            self._handler_templar.set_available_variables(variables)
+        return self._handler_templar
+
+    def _drain_results(self, limit=None):
+        '''
+        Moves up to limit (default all) results queued by the results thread
+        into a local deque, so they can be processed without going back to
+        the shared queue for each of them.
+        '''
+        batch = deque()
+        popleft = self._results.popleft
+        try:
+            while limit is None or len(batch) < limit:
+                batch.append(popleft())
+        except IndexError:
+            pass
+        return batch
+
     def _wait_on_pending_results(self, iterator):
         '''
-        Wait for the shared counter to drop to zero, using a short sleep
-        between checks to ensure we don't spin lock
+        Wait for the shared counter to drop to zero. Between checks this waits
+        for the results thread to hand over new results, bounded by a timeout
+        so dead workers are still noticed. The timeout starts at the internal
+        poll interval and doubles (up to a cap) while no results arrive, so
+        long running tasks do not keep the main process busy.
         '''
 
         ret_results = []
 
+        poll_interval = C.DEFAULT_INTERNAL_POLL_INTERVAL
+        max_poll_interval = max(poll_interval * 64, 0.05)
+        sleep_time = poll_interval
+
         display.debug("waiting for pending results...")
         while self._pending_results > 0 and not self._tqm._terminated:
 
             if self._tqm.has_dead_workers():
                 raise AnsibleError("A worker was found in a dead state")
 
+            # cleared before reading, so results handed over from now on
+            # cut the wait below short
+            self._results_ready.clear()
             results = self._process_pending_results(iterator)
             ret_results.extend(results)
             if self._pending_results > 0:
-                time.sleep(C.DEFAULT_INTERNAL_POLL_INTERVAL)
+                if results:
+                    sleep_time = poll_interval
+                else:
+                    sleep_time = min(sleep_time * 2, max_poll_interval)
+                self._results_ready.wait(sleep_time)
 
         display.debug("no more pending results, returning what we have")
 
@@ -643,14 +902,12 @@ class StrategyBase:
             new_host.vars = combine_vars(new_host.get_vars(), host_info.get('host_vars', dict()))
 
             new_groups = host_info.get('groups', [])
-            for group_name in new_groups:
-                if group_name not in self._inventory.groups:
-                    self._inventory.add_group(group_name)
-                new_group = self._inventory.groups[group_name]
-                new_group.add_host(self._inventory.hosts[host_name])
+            if new_groups:
+                self._inventory.add_host_to_groups(host_name, new_groups)
 
-            # reconcile inventory, ensures inventory rules are followed
-            self._inventory.reconcile_inventory()
+            # inventory is reconciled once the current batch of results has
+            # been processed, see _process_pending_results
+            self._inventory_dirty = True
 
     def _add_group(self, host, result_item):
         '''
@@ -677,16 +934,16 @@ class StrategyBase:
             parent_group = self._inventory.groups[parent_group_name]
             parent_group.add_child_group(group)
 
-        if real_host.name not in group.get_hosts():
+        if real_host.name not in group.host_names:
             group.add_host(real_host)
             changed = True
 
-        if group_name not in host.get_groups():
+        if group not in real_host.get_groups():
             real_host.add_group(group)
             changed = True
 
         if changed:
-            self._inventory.reconcile_inventory()
+            self._inventory_dirty = True
 
         return changed
 
@@ -697,10 +954,8 @@ class StrategyBase:
         ti_copy = included_file._task.copy(exclude_parent=True)
         ti_copy._parent = included_file._task._parent
 
-        temp_vars = ti_copy.vars.copy()
-        temp_vars.update(included_file._args)
-
-        ti_copy.vars = temp_vars
+        # copy() already gave the new task its own (shallow) vars dict
+        ti_copy.vars.update(included_file._args)
 
         return ti_copy
 
@@ -721,11 +976,11 @@ class StrategyBase:
             # pop tags out of the include args, if they were specified there, and assign
             # them to the include. If the include already had tags specified, we raise an
             # error so that users know not to specify them both ways
-            tags = included_file._task.vars.pop('tags', [])
-            if isinstance(tags, string_types):
-                tags = tags.split(',')
-            if len(tags) > 0:
-                if len(included_file._task.tags) > 0:
+            tags = included_file._task.vars.pop('tags', None)
+            if tags:
+                if isinstance(tags, string_types):
+                    tags = tags.split(',')
+                if included_file._task.tags:
                     raise AnsibleParserError("Include tasks should not specify tags in more than one way (both via args and directly on the task). "
                                              "Mixing tag specify styles is prohibited for whole import hierarchy, not only for single import statement",
                                              obj=included_file._task._ds)
@@ -789,29 +1044,35 @@ class StrategyBase:
         #     self._tqm.send_callback('v2_playbook_on_no_hosts_remaining')
         #     result = False
         #     break
-        saved_name = handler.name
-        handler.name = handler_name
-        self._tqm.send_callback('v2_playbook_on_handler_task_start', handler)
-        handler.name = saved_name
+        # callbacks only see the handler object, so swap in the display name
+        # for the duration of the callback when it differs from handler.name
+        if handler.name == handler_name:
+            self._tqm.send_callback('v2_playbook_on_handler_task_start', handler)
+        else:
+            saved_name = handler.name
+            handler.name = handler_name
+            try:
+                self._tqm.send_callback('v2_playbook_on_handler_task_start', handler)
+            finally:
+                handler.name = saved_name
 
         if notified_hosts is None:
             notified_hosts = self._notified_handlers[handler._uuid]
 
-        run_once = False
-        try:
-            action = action_loader.get(handler.action, class_only=True)
-            if handler.run_once or getattr(action, 'BYPASS_HOST_LOOP', False):
-                run_once = True
-        except KeyError:
-            # we don't care here, because the action may simply not have a
-            # corresponding action plugin
-            pass
+        run_once = bool(handler.run_once or self._action_bypasses_host_loop(handler.action))
+
+        # no results are read while the handler is queued, so the TQM state
+        # variables are the same for every host and only computed once
+        tqm_vars = None
 
         host_results = []
         for host in notified_hosts:
             if not handler.has_triggered(host) and (not iterator.is_failed(host) or play_context.force_handlers):
                 task_vars = self._variable_manager.get_vars(play=iterator._play, host=host, task=handler)
-                self.add_tqm_variables(task_vars, play=iterator._play)
+                if tqm_vars is None:
+                    tqm_vars = {}
+                    self.add_tqm_variables(tqm_vars, play=iterator._play)
+                task_vars.update(tqm_vars)
                 self._queue_task(host, handler, task_vars, play_context)
                 if run_once:
                     break
@@ -858,8 +1119,9 @@ class StrategyBase:
                     display.warning(str(e))
                     continue
 
-        # wipe the notification list
+        # wipe the notification list (and the set mirroring it)
         self._notified_handlers[handler._uuid] = []
+        self._notified_hosts.pop(handler._uuid, None)
         display.debug("done running handlers, result is: %s" % result)
         return result
 
@@ -897,6 +1159,9 @@ class StrategyBase:
         #   on a meta task that doesn't support them
 
         def _evaluate_conditional(h):
+            if not task.when and not isinstance(task.when, bool):
+                # nothing to evaluate, skip building the vars and templar
+                return True
             all_vars = self._variable_manager.get_vars(play=iterator._play, host=h, task=task)
             templar = Templar(loader=self._loader, variables=all_vars)
             return task.evaluate_conditional(templar, all_vars)
@@ -911,6 +1176,7 @@ class StrategyBase:
             msg = "ran handlers"
         elif meta_action == 'refresh_inventory':
             self._inventory.refresh_inventory()
+            self._variable_manager.invalidate_hostvars()
             msg = "inventory successfully refreshed"
         elif meta_action == 'clear_facts':
             if _evaluate_conditional(target_host):
@@ -959,8 +1225,6 @@ class StrategyBase:
     def get_hosts_left(self, iterator):
         ''' returns list of available hosts for this iterator by filtering out unreachables '''
 
-        hosts_left = []
-        for host in self._inventory.get_hosts(iterator._play.hosts, order=iterator._play.order):
-            if host.name not in self._tqm._unreachable_hosts:
-                hosts_left.append(host)
-        return hosts_left
+        unreachable = self._tqm._unreachable_hosts
+        return [host for host in self._inventory.get_hosts(iterator._play.hosts, order=iterator._play.order)
+                if host.name not in unreachable]
@@ -34,7 +34,6 @@ import time
 from ansible import constants as C
 from ansible.errors import AnsibleError
 from ansible.playbook.included_file import IncludedFile
-from ansible.plugins.loader import action_loader
 from ansible.plugins.strategy import StrategyBase
 from ansible.template import Templar
 from ansible.module_utils._text import to_text
@@ -107,13 +106,6 @@ class StrategyModule(StrategyBase):
                         self._blocked_hosts[host_name] = True
                         (state, task) = iterator.get_next_task_for_host(host)
 
-                        try:
-                            action = action_loader.get(task.action, class_only=True)
-                        except KeyError:
-                            # we don't care here, because the action may simply not have a
-                            # corresponding action plugin
-                            action = None
-
                         display.debug("getting variables")
                         task_vars = self._variable_manager.get_vars(play=iterator._play, host=host, task=task)
                         self.add_tqm_variables(task_vars, play=iterator._play)
@@ -129,9 +121,10 @@ class StrategyModule(StrategyBase):
                             display.debug("templating failed for some reason")
                             pass
 
-                        run_once = templar.template(task.run_once) or action and getattr(action, 'BYPASS_HOST_LOOP', False)
+                        bypass_host_loop = self._action_bypasses_host_loop(task.action)
+                        run_once = templar.template(task.run_once) or bypass_host_loop
                         if run_once:
-                            if action and getattr(action, 'BYPASS_HOST_LOOP', False):
+                            if bypass_host_loop:
                                 raise AnsibleError("The '%s' module bypasses the host loop, which is currently not supported in the free strategy "
                                                    "and would instead execute for every host in the inventory list." % task.action, obj=task._ds)
                             else:
@@ -24,7 +24,48 @@ import re
 from abc import ABCMeta, abstractmethod
 
 from ansible.errors import AnsibleConnectionFailure
-from ansible.module_utils.six import with_metaclass
+from ansible.module_utils.six import binary_type, with_metaclass
+
+
+_MERGED_REGEX_CACHE = {}
+_INLINE_FLAGS_RE = re.compile(r'\(\?[aiLmsux]')
+
+
+def merge_regex(regexes):
+    '''
+    Returns a list of compiled regular expressions that, taken together,
+    match wherever any of the given ones does, for checks that only need to
+    know whether one of them matches (not which one or where).  Expressions
+    without groups or inline flags that share the same flags are joined into
+    a single alternation, so the response is scanned once per set of flags
+    instead of once per expression.  The result is cached per list.
+    '''
+    key = tuple(regexes)
+    try:
+        return _MERGED_REGEX_CACHE[key]
+    except KeyError:
+        pass
+
+    result = []
+    groups = {}
+    for regex in regexes:
+        pattern = regex.pattern
+        text_pattern = pattern.decode('latin-1') if isinstance(pattern, binary_type) else pattern
+        if regex.groups or _INLINE_FLAGS_RE.search(text_pattern):
+            result.append(regex)
+        else:
+            groups.setdefault((regex.flags, type(pattern)), []).append(regex)
+
+    for (flags, pattern_type), group in groups.items():
+        if len(group) == 1:
+            result.append(group[0])
+        elif pattern_type is binary_type:
+            result.append(re.compile(b'|'.join(b'(?:' + regex.pattern + b')' for regex in group), flags))
+        else:
+            result.append(re.compile(u'|'.join(u'(?:' + regex.pattern + u')' for regex in group), flags))
+
+    _MERGED_REGEX_CACHE[key] = result
+    return result
 
 
 class TerminalBase(with_metaclass(ABCMeta, object)):
@@ -75,6 +116,11 @@ class TerminalBase(with_metaclass(ABCMeta, object)):
         """
         Returns the current prompt from the device
 
+        Only the newline goes to the device: its response is read up to the
+        prompt, which the connection strips from the output and remembers.
+        ``prompt()`` is answered by the connection with that remembered
+        prompt without another round trip.
+
         :returns: A byte string of the prompt
         """
         for cmd in (b'\n', b'prompt()'):
@@ -26,6 +26,10 @@ from ansible.errors import AnsibleConnectionFailure
 from ansible.module_utils._text import to_text, to_bytes
 from ansible.plugins.terminal import TerminalBase
 
+# the enable command when no password is given, serialized once instead of
+# going through json.dumps() on every privilege escalation
+ENABLE_CMD = b'{"command": "enable"}'
+
 
 class TerminalModule(TerminalBase):
 
@@ -56,15 +60,18 @@ class TerminalModule(TerminalBase):
         if self._get_prompt().endswith(b'#'):
             return
 
-        cmd = {u'command': u'enable'}
         if passwd:
+            cmd = {u'command': u'enable'}
             # Note: python-3.5 cannot combine u"" and r"" together.  Thus make
             # an r string and use to_text to ensure it's text on both py2 and py3.
             cmd[u'prompt'] = to_text(r"[\r\n]?password: $", errors='surrogate_or_strict')
             cmd[u'answer'] = passwd
+            cmd = to_bytes(json.dumps(cmd), errors='surrogate_or_strict')
+        else:
+            cmd = ENABLE_CMD
 
         try:
-            self._exec_cli_command(to_bytes(json.dumps(cmd), errors='surrogate_or_strict'))
+            self._exec_cli_command(cmd)
         except AnsibleConnectionFailure:
             raise AnsibleConnectionFailure('unable to elevate privilege to enable mode')
 
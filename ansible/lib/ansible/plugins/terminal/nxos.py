@@ -26,6 +26,10 @@ from ansible.plugins.terminal import TerminalBase
 from ansible.errors import AnsibleConnectionFailure
 from ansible.module_utils._text import to_bytes, to_text
 
+# the enable command when no password is given, serialized once instead of
+# going through json.dumps() on every privilege escalation
+ENABLE_CMD = b'{"command": "enable"}'
+
 
 class TerminalModule(TerminalBase):
 
@@ -62,13 +66,16 @@ class TerminalModule(TerminalBase):
         if '15' in out:
             return
 
-        cmd = {u'command': u'enable'}
         if passwd:
+            cmd = {u'command': u'enable'}
             cmd[u'prompt'] = to_text(r"(?i)[\r\n]?Password: $", errors='surrogate_or_strict')
             cmd[u'answer'] = passwd
+            cmd = to_bytes(json.dumps(cmd), errors='surrogate_or_strict')
+        else:
+            cmd = ENABLE_CMD
 
         try:
-            self._exec_cli_command(to_bytes(json.dumps(cmd), errors='surrogate_or_strict'))
+            self._exec_cli_command(cmd)
         except AnsibleConnectionFailure:
             raise AnsibleConnectionFailure('unable to elevate privilege to enable mode')
 
@@ -21,6 +21,8 @@ __metaclass__ = type
 
 import collections
 
+from hashlib import sha1
+
 from jinja2.runtime import Undefined
 
 from ansible.module_utils._text import to_bytes
@@ -42,11 +44,6 @@ STATIC_VARS = [
     'ungrouped',
 ]
 
-try:
-    from hashlib import sha1
-except ImportError:
-    from sha import sha as sha1
-
 __all__ = ['HostVars']
 
 
@@ -61,6 +58,13 @@ class HostVars(collections.Mapping):
         self._variable_manager = variable_manager
         variable_manager._hostvars = self
         self._cached_result = dict()
+        self._templar = None
+
+    def __getstate__(self):
+        # the templar is only reused within one process
+        data = self.__dict__.copy()
+        data['_templar'] = None
+        return data
 
     def set_variable_manager(self, variable_manager):
         self._variable_manager = variable_manager
@@ -85,12 +89,38 @@ class HostVars(collections.Mapping):
         return self._variable_manager.get_vars(host=host, include_hostvars=False)
 
     def __getitem__(self, host_name):
-        data = self.raw_get(host_name)
-        sha1_hash = sha1(to_bytes(data)).hexdigest()
-        if sha1_hash not in self._cached_result:
+        # the templated vars are kept per host along with the variable manager
+        # version they were built for, and rebuilt once that has changed, so
+        # there is at most one entry per host
+        data = None
+        key = getattr(self._variable_manager, '_version', None)
+        if key is None:
+            # no change tracking on this variable manager, so the contents of
+            # the host's vars are the key instead
+            data = self.raw_get(host_name)
+            key = sha1(to_bytes(data)).hexdigest()
+
+        cached = self._cached_result.get(host_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        if data is None:
+            data = self.raw_get(host_name)
+        if isinstance(data, Undefined):
+            return data
+
+        # one templar is reused for all hosts, and is taken while in use in
+        # case templating comes back here for another host
+        templar, self._templar = self._templar, None
+        if templar is None:
             templar = Templar(variables=data, loader=self._loader)
-            self._cached_result[sha1_hash] = templar.template(data, fail_on_undefined=False, static_vars=STATIC_VARS)
-        return self._cached_result[sha1_hash]
+        else:
+            templar.set_available_variables(data)
+        result = templar.template(data, fail_on_undefined=False, static_vars=STATIC_VARS)
+        self._templar = templar
+
+        self._cached_result[host_name] = (key, result)
+        return result
 
     def set_host_variable(self, host, varname, value):
         self._variable_manager.set_host_variable(host, varname, value)
@@ -123,6 +123,10 @@ class VariableManager:
         self._omit_token = '__omit_place_holder__%s' % sha1(os.urandom(64)).hexdigest()
         self._options_vars = defaultdict(dict)
 
+        # bumped whenever host variables may have changed, so HostVars can
+        # tell whether its templated copy of a host's vars is still current
+        self._version = 0
+
         # bad cache plugin is not fatal error
         try:
             self._fact_cache = FactCache()
@@ -142,6 +146,7 @@ class VariableManager:
             omit_token=self._omit_token,
             options_vars=self._options_vars,
             inventory=self._inventory,
+            version=self._version,
         )
         return data
 
@@ -155,6 +160,7 @@ class VariableManager:
         self._omit_token = data.get('omit_token', '__omit_place_holder__%s' % sha1(os.urandom(64)).hexdigest())
         self._inventory = data.get('inventory', None)
         self._options_vars = data.get('options_vars', dict())
+        self._version = data.get('version', 0)
 
     @property
     def extra_vars(self):
@@ -166,9 +172,18 @@ class VariableManager:
         ''' ensures a clean copy of the extra_vars are used to set the value '''
         assert isinstance(value, MutableMapping), "the type of 'value' for extra_vars should be a MutableMapping, but is a %s" % type(value)
         self._extra_vars = value.copy()
+        self.invalidate_hostvars()
 
     def set_inventory(self, inventory):
         self._inventory = inventory
+        self.invalidate_hostvars()
+
+    def invalidate_hostvars(self):
+        '''
+        Marks the variables of all hosts as changed, for changes made outside
+        of the variable manager (e.g. hosts or groups added to inventory)
+        '''
+        self._version += 1
 
     @property
     def options_vars(self):
@@ -180,6 +195,7 @@ class VariableManager:
         ''' ensures a clean copy of the options_vars are used to set the value '''
         assert isinstance(value, dict), "the type of 'value' for options_vars should be a dict, but is a %s" % type(value)
         self._options_vars = value.copy()
+        self.invalidate_hostvars()
 
     def _preprocess_vars(self, a):
         '''
@@ -605,6 +621,7 @@ class VariableManager:
         '''
         if hostname in self._fact_cache:
             del self._fact_cache[hostname]
+        self.invalidate_hostvars()
 
     def set_host_facts(self, host, facts):
         '''
@@ -620,6 +637,7 @@ class VariableManager:
                 self._fact_cache.update(host.name, facts)
             except KeyError:
                 self._fact_cache[host.name] = facts
+        self.invalidate_hostvars()
 
     def set_nonpersistent_facts(self, host, facts):
         '''
@@ -635,6 +653,7 @@ class VariableManager:
                 self._nonpersistent_fact_cache[host.name].update(facts)
             except KeyError:
                 self._nonpersistent_fact_cache[host.name] = facts
+        self.invalidate_hostvars()
 
     def set_host_variable(self, host, varname, value):
         '''
@@ -647,3 +666,4 @@ class VariableManager:
             self._vars_cache[host_name] = combine_vars(self._vars_cache[host_name], {varname: value})
         else:
             self._vars_cache[host_name][varname] = value
+        self.invalidate_hostvars()
@@ -48,6 +48,9 @@ ansible-playbook test_listening_handlers.yml -i inventory.handlers -v "$@"
 # Notify handler listen
 ansible-playbook test_handlers_listen.yml -i inventory.handlers -v "$@"
 
+# Notify handlers whose names only use jinja2 statements or comments
+ansible-playbook test_handlers_template_names.yml -i inventory.handlers -v "$@"
+
 # Notify inexistent handlers results in error
 set +e
 result="$(ansible-playbook test_handlers_inexistent_notify.yml -i inventory.handlers "$@" 2>&1)"
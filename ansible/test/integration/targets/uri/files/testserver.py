@@ -9,8 +9,11 @@ if __name__ == '__main__':
         class Handler(http.server.SimpleHTTPRequestHandler):
             pass
 
+        class ThreadingServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+            daemon_threads = True
+
         Handler.extensions_map['.json'] = 'application/json'
-        httpd = socketserver.TCPServer(("", PORT), Handler)
+        httpd = ThreadingServer(("", PORT), Handler)
         httpd.serve_forever()
     else:
         import mimetypes
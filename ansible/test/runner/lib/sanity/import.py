@@ -1,8 +1,13 @@
 """Sanity test for proper import exception handling."""
 from __future__ import absolute_import, print_function
 
+import functools
+import multiprocessing
 import os
 import re
+import time
+
+import lib.thread
 
 from lib.sanity import (
     SanityMultipleVersion,
@@ -17,6 +22,7 @@ from lib.util import (
     run_command,
     intercept_command,
     remove_tree,
+    get_coverage_path,
 )
 
 from lib.ansible_util import (
@@ -49,8 +55,8 @@ class ImportTest(SanityMultipleVersion):
         paths = sorted(
             i.path
             for i in targets.include
-            if os.path.splitext(i.path)[1] == '.py' and
-            (i.path.startswith('lib/ansible/modules/') or i.path.startswith('lib/ansible/module_utils/')) and
+            if i.path.endswith('.py') and
+            i.path.startswith(('lib/ansible/modules/', 'lib/ansible/module_utils/')) and
             i.path not in skip_paths_set
         )
 
@@ -88,22 +94,36 @@ class ImportTest(SanityMultipleVersion):
             run_command(args, ['pip', 'uninstall', '--disable-pip-version-check', '-y', 'setuptools'], env=env)
             run_command(args, ['pip', 'uninstall', '--disable-pip-version-check', '-y', 'pip'], env=env)
 
-        cmd = ['importer.py'] + paths
+        get_coverage_path(args)  # initialize before starting threads
 
-        results = []
+        # the paths are split between one importer per cpu, run in parallel
+        importer_count = min(multiprocessing.cpu_count(), len(paths))
+        instances = []  # type: list [lib.thread.WrappedThread]
 
-        try:
-            stdout, stderr = intercept_command(args, cmd, target_name=self.name, env=env, capture=True, python_version=python_version, path=env['PATH'])
+        for index in range(importer_count):
+            cmd = ['importer.py'] + paths[index::importer_count]
+            instance = lib.thread.WrappedThread(functools.partial(self.run_importer, args, cmd, env.copy(), python_version))
+            instance.daemon = True
+            instance.start()
+            instances.append(instance)
 
-            if stdout or stderr:
-                raise SubprocessError(cmd, stdout=stdout, stderr=stderr)
-        except SubprocessError as ex:
-            if ex.status != 10 or ex.stderr or not ex.stdout:
-                raise
+        while any(instance.is_alive() for instance in instances):
+            time.sleep(1)
+
+        lines = []
+
+        for instance in instances:
+            for line in instance.wait_for_result():
+                # each importer reports an error once, even when several of its paths hit it
+                if line not in lines:
+                    lines.append(line)
 
+        results = []
+
+        if lines:
             pattern = r'^(?P<path>[^:]*):(?P<line>[0-9]+):(?P<column>[0-9]+): (?P<message>.*)$'
 
-            results = [re.search(pattern, line).groupdict() for line in ex.stdout.splitlines()]
+            results = [re.search(pattern, line).groupdict() for line in lines]
 
             results = [SanityMessage(
                 message=r['message'],
@@ -118,3 +138,24 @@ class ImportTest(SanityMultipleVersion):
             return SanityFailure(self.name, messages=results, python_version=python_version)
 
         return SanitySuccess(self.name, python_version=python_version)
+
+    def run_importer(self, args, cmd, env, python_version):
+        """
+        :type args: SanityConfig
+        :type cmd: list[str]
+        :type env: dict[str, str]
+        :type python_version: str
+        :rtype: list[str]
+        """
+        try:
+            stdout, stderr = intercept_command(args, cmd, target_name=self.name, env=env, capture=True, python_version=python_version, path=env['PATH'])
+
+            if stdout or stderr:
+                raise SubprocessError(cmd, stdout=stdout, stderr=stderr)
+        except SubprocessError as ex:
+            if ex.status != 10 or ex.stderr or not ex.stdout:
+                raise
+
+            return ex.stdout.splitlines()
+
+        return []
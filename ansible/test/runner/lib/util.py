@@ -28,7 +28,11 @@ except ImportError:
 
 DOCKER_COMPLETION = {}
 
+# executables found by find_executable, keyed by its arguments and the real cwd
+EXECUTABLE_CACHE = {}
+
 coverage_path = ''  # pylint: disable=locally-disabled, invalid-name
+injector_config = None  # pylint: disable=locally-disabled, invalid-name
 
 
 def get_docker_completion():
@@ -59,6 +63,22 @@ def remove_file(path):
         os.remove(path)
 
 
+def move_file(src, dst):
+    """
+    :type src: str
+    :type dst: str
+    """
+    try:
+        os.rename(src, dst)
+    except OSError as ex:
+        if ex.errno != errno.EXDEV:
+            raise
+
+        # the source and destination are on different file systems
+        shutil.copy(src, dst)
+        os.remove(src)
+
+
 def find_pip(path=None, version=None):
     """
     :type path: str | None
@@ -112,20 +132,26 @@ def find_executable(executable, cwd=None, path=None, required=True):
     :type required: bool | str
     :rtype: str | None
     """
-    match = None
     real_cwd = os.getcwd()
 
     if not cwd:
         cwd = real_cwd
 
+    if not os.path.dirname(executable) and path is None:
+        path = os.environ.get('PATH', os.defpath)
+
+    # only matches are cached, since a missing program may be installed later
+    cache_key = (executable, cwd, real_cwd, path)
+    match = EXECUTABLE_CACHE.get(cache_key)
+
+    if match:
+        return match
+
     if os.path.dirname(executable):
         target = os.path.join(cwd, executable)
         if os.path.exists(target) and os.access(target, os.F_OK | os.X_OK):
             match = executable
     else:
-        if path is None:
-            path = os.environ.get('PATH', os.defpath)
-
         if path:
             path_dirs = path.split(os.pathsep)
             seen_dirs = set()
@@ -145,7 +171,9 @@ def find_executable(executable, cwd=None, path=None, required=True):
                     match = candidate
                     break
 
-    if not match and required:
+    if match:
+        EXECUTABLE_CACHE[cache_key] = match
+    elif required:
         message = 'Required program "%s" not found.' % executable
 
         if required != 'warning':
@@ -169,6 +197,8 @@ def intercept_command(args, cmd, target_name, capture=False, env=None, data=None
     :type path: str | None
     :rtype: str | None, str | None
     """
+    global injector_config  # pylint: disable=locally-disabled, global-statement, invalid-name
+
     if not env:
         env = common_environment()
 
@@ -189,10 +219,19 @@ def intercept_command(args, cmd, target_name, capture=False, env=None, data=None
         coverage_file=coverage_file if args.coverage else None,
     )
 
-    if not args.explain:
-        with open(config_path, 'w') as config_fd:
+    # the config only changes with the python version or test target
+    if not args.explain and config != injector_config:
+        # the config is renamed into place, since commands intercepted from
+        # multiple threads must never see a partially written config
+        config_fd, config_temp_path = tempfile.mkstemp(dir=inject_path)
+        os.chmod(config_temp_path, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
+
+        with os.fdopen(config_fd, 'w') as config_fd:
             json.dump(config, config_fd, indent=4, sort_keys=True)
 
+        os.rename(config_temp_path, config_path)
+        injector_config = config
+
     return run_command(args, cmd, capture=capture, env=env, data=data, cwd=cwd)
 
 
@@ -236,20 +275,22 @@ def get_coverage_path(args):
 def cleanup_coverage_dir():
     """Copy over coverage data from temporary directory and purge temporary directory."""
     output_dir = os.path.join(coverage_path, 'output')
+    coverage_dir = os.path.join(os.getcwd(), 'test', 'results', 'coverage')
 
     for filename in os.listdir(output_dir):
         src = os.path.join(output_dir, filename)
-        dst = os.path.join(os.getcwd(), 'test', 'results', 'coverage')
-        shutil.copy(src, dst)
+        dst = os.path.join(coverage_dir, filename)
+        move_file(src, dst)
 
     logs_dir = os.path.join(coverage_path, 'logs')
+    results_logs_dir = os.path.join(os.getcwd(), 'test', 'results', 'logs')
 
     for filename in os.listdir(logs_dir):
         random_suffix = ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(8))
         new_name = '%s.%s.log' % (os.path.splitext(os.path.basename(filename))[0], random_suffix)
         src = os.path.join(logs_dir, filename)
-        dst = os.path.join(os.getcwd(), 'test', 'results', 'logs', new_name)
-        shutil.copy(src, dst)
+        dst = os.path.join(results_logs_dir, new_name)
+        move_file(src, dst)
 
     shutil.rmtree(coverage_path)
 
@@ -454,8 +495,13 @@ def is_binary_file(path):
     :type path: str
     :rtype: bool
     """
-    with open(path, 'rb') as path_fd:
-        return b'\0' in path_fd.read(1024)
+    # read without a file object, since this runs for every untracked file
+    path_fd = os.open(path, os.O_RDONLY)
+
+    try:
+        return b'\0' in os.read(path_fd, 1024)
+    finally:
+        os.close(path_fd)
 
 
 class Display(object):
@@ -25,6 +25,10 @@ from ansible.compat.tests import unittest
 from ansible.module_utils.six import string_types
 from ansible.module_utils._text import to_text
 
+from ansible.errors import AnsibleError
+from ansible.inventory.data import InventoryData
+from ansible.inventory.group import Group
+from ansible.inventory.host import Host
 from ansible.inventory.manager import InventoryManager, split_host_pattern
 
 from units.mock.loader import DictDataLoader
@@ -173,3 +177,53 @@ class IniInventory(unittest.TestCase):
         self.assertEqual(set(['host1', 'host2', 'host3']), ungrouped_hosts)
         servers_hosts = set(host.name for host in inventory.groups['servers'].get_hosts())
         self.assertEqual(set(['host3', 'host4', 'host5']), servers_hosts)
+
+
+class TestGroupHostNames(unittest.TestCase):
+
+    def test_host_names(self):
+        group = Group('web')
+        host = Host('web01')
+        group.add_host(host)
+        group.add_host(host)
+        self.assertEqual(group.hosts, [host])
+        self.assertEqual(group.host_names, set(['web01']))
+
+        # the name set is rebuilt from the hosts after deserialization
+        group = Group()
+        group.deserialize(dict(name='web', hosts=[host]))
+        self.assertIn('web01', group.host_names)
+        group.add_host(host)
+        self.assertEqual(group.hosts, [host])
+
+
+class TestInventoryData(unittest.TestCase):
+
+    def test_add_host_to_groups(self):
+        inventory = InventoryData()
+        inventory.add_group('web')
+        inventory.add_host('web01', 'web')
+
+        inventory.add_host_to_groups('web01', ['web', 'db', 'db'])
+        self.assertEqual(inventory.groups['web'].hosts, [inventory.hosts['web01']])
+        self.assertEqual(inventory.groups['db'].hosts, [inventory.hosts['web01']])
+        self.assertEqual(inventory.get_groups_dict()['db'], ['web01'])
+
+        self.assertRaises(AnsibleError, inventory.add_host_to_groups, 'web02', ['web'])
+
+    def test_set_variables(self):
+        inventory = InventoryData()
+        inventory.add_group('web')
+        inventory.add_host('web01', 'web')
+
+        # keys loaded from yaml are not always strings
+        inventory.set_variables('web01', {'a': 1, 2: 'two', True: 'yes'})
+        self.assertEqual(inventory.hosts['web01'].vars['a'], 1)
+        self.assertEqual(inventory.hosts['web01'].vars[2], 'two')
+        self.assertEqual(inventory.hosts['web01'].vars[True], 'yes')
+
+        inventory.set_variables('web', {'b': 2, 3: 'three', 'ansible_group_priority': '5'})
+        self.assertEqual(inventory.groups['web'].vars, {'b': 2, 3: 'three'})
+        self.assertEqual(inventory.groups['web'].priority, 5)
+
+        self.assertRaises(AnsibleError, inventory.set_variables, 'db', {'a': 1})
@@ -26,6 +26,13 @@ from ansible.modules.network.ios import ios_user
 from .ios_module import TestIosModule, load_fixture, set_module_args
 
 
+REMOVE_USER_ANSIBLE_CMD = {
+    "answer": "y",
+    "prompt": "This operation will remove all username related configurations with same name",
+    "command": "no username ansible",
+}
+
+
 class TestIosUserModule(TestIosModule):
 
     module = ios_user
@@ -53,17 +60,8 @@ class TestIosUserModule(TestIosModule):
     def test_ios_user_delete(self):
         set_module_args(dict(name='ansible', state='absent'))
         result = self.execute_module(changed=True)
-        cmd = json.loads(
-            '{"answer": "y", ' +
-            '"prompt": "This operation will remove all username related ' +
-            'configurations with same name", "command": "no username ansible"}'
-        )
-
-        result_cmd = []
-        for i in result['commands']:
-            result_cmd.append(json.loads(i))
-
-        self.assertEqual(result_cmd, [cmd])
+        result_cmd = [json.loads(i) for i in result['commands']]
+        self.assertEqual(result_cmd, [REMOVE_USER_ANSIBLE_CMD])
 
     def test_ios_user_password(self):
         set_module_args(dict(name='ansible', configured_password='test'))
@@ -82,17 +80,8 @@ class TestIosUserModule(TestIosModule):
     def test_ios_user_purge(self):
         set_module_args(dict(purge=True))
         result = self.execute_module(changed=True)
-        cmd = json.loads(
-            '{"answer": "y", ' +
-            '"prompt": "This operation will remove all username related ' +
-            'configurations with same name", "command": "no username ansible"}'
-        )
-
-        result_cmd = []
-        for i in result['commands']:
-            result_cmd.append(json.loads(i))
-
-        self.assertEqual(result_cmd, [cmd])
+        result_cmd = [json.loads(i) for i in result['commands']]
+        self.assertEqual(result_cmd, [REMOVE_USER_ANSIBLE_CMD])
 
     def test_ios_user_view(self):
         set_module_args(dict(name='ansible', view='test'))
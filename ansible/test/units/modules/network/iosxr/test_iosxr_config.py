@@ -20,8 +20,6 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-import json
-
 from ansible.compat.tests.mock import patch
 from ansible.modules.network.iosxr import iosxr_config
 from .iosxr_module import TestIosxrModule, load_fixture, set_module_args
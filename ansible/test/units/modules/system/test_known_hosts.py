@@ -9,12 +9,23 @@ from ansible.modules.system.known_hosts import compute_diff
 
 class KnownHostsDiffTestCase(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # compute_diff only reads the file, so tests using the same content share it
+        cls._files = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        for path in cls._files.values():
+            os.unlink(path)
+
     def _create_file(self, content):
-        tmp_file = tempfile.NamedTemporaryFile(prefix='ansible-test-', suffix='-known_hosts', delete=False)
-        tmp_file.write(to_bytes(content))
-        tmp_file.close()
-        self.addCleanup(os.unlink, tmp_file.name)
-        return tmp_file.name
+        if content not in self._files:
+            tmp_file = tempfile.NamedTemporaryFile(prefix='ansible-test-', suffix='-known_hosts', delete=False)
+            tmp_file.write(to_bytes(content))
+            tmp_file.close()
+            self._files[content] = tmp_file.name
+        return self._files[content]
 
     def test_no_existing_file(self):
         path = tempfile.mktemp(prefix='ansible-test-', suffix='-known_hosts')
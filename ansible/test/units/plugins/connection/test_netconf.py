@@ -99,7 +99,7 @@ class TestNetconfConnectionClass(unittest.TestCase):
 
         rc, out, err = conn.exec_command('<test/>')
 
-        netconf.to_ele.assert_called_with('<test/>')
+        netconf.etree.fromstring.assert_called_with(b'<test/>')
 
         self.assertEqual(0, rc)
         self.assertEqual(b'<test/>', out)
@@ -112,10 +112,55 @@ class TestNetconfConnectionClass(unittest.TestCase):
         conn = netconf.Connection(pc, new_stdin)
         conn._connected = True
 
-        netconf.to_ele.return_value = None
+        netconf.etree.fromstring.return_value = None
 
         rc, out, err = conn.exec_command('test string')
 
         self.assertEqual(1, rc)
         self.assertEqual(b'', out)
         self.assertEqual(b'unable to parse request', err)
+
+    def test_netconf_exec_command_jsonrpc(self):
+        pc = PlayContext()
+        new_stdin = StringIO()
+
+        conn = netconf.Connection(pc, new_stdin)
+        conn._connected = True
+
+        mock_netconf = MagicMock(name='self._netconf')
+        mock_netconf.get_capabilities.return_value = 'capabilities'
+        conn._netconf = mock_netconf
+        conn._rpc.add(mock_netconf)
+        conn._manager = MagicMock(name='self._manager')
+
+        request = json.dumps({'jsonrpc': '2.0', 'method': 'get_capabilities', 'id': 1})
+        rc, out, err = conn.exec_command(request)
+
+        self.assertEqual(0, rc)
+        self.assertEqual({'jsonrpc': '2.0', 'id': 1, 'result': 'capabilities'}, json.loads(out.decode('utf-8')))
+        self.assertEqual(b'', err)
+        self.assertFalse(conn._manager.rpc.called)
+
+    def test_netconf_exec_command_xml_skips_json(self):
+        pc = PlayContext()
+        new_stdin = StringIO()
+
+        conn = netconf.Connection(pc, new_stdin)
+        conn._connected = True
+
+        mock_manager = MagicMock(name='self._manager')
+        mock_reply = MagicMock(name='reply')
+        type(mock_reply).data_xml = PropertyMock(return_value='<reply/>')
+        mock_manager.rpc.return_value = mock_reply
+        conn._manager = mock_manager
+
+        netconf.etree.fromstring.return_value = MagicMock(name='req')
+
+        with patch.object(netconf.json, 'loads') as mock_loads:
+            rc, out, err = conn.exec_command(b'  <get-config/>')
+
+        self.assertFalse(mock_loads.called)
+        netconf.etree.fromstring.assert_called_with(b'<get-config/>')
+        self.assertEqual(0, rc)
+        self.assertEqual(b'<reply/>', out)
+        self.assertEqual(b'', err)
@@ -31,6 +31,7 @@ from ansible.compat.tests.mock import patch, MagicMock
 from ansible.errors import AnsibleConnectionFailure
 from ansible.playbook.play_context import PlayContext
 from ansible.plugins.connection import network_cli
+from ansible.plugins.terminal import TerminalBase, merge_regex
 
 
 class TestConnectionClass(unittest.TestCase):
@@ -163,3 +164,31 @@ class TestConnectionClass(unittest.TestCase):
         with self.assertRaises(AnsibleConnectionFailure) as exc:
             conn.send(b'command', None, None, None)
         self.assertEqual(str(exc.exception), 'ERROR: error message device#')
+
+    def test_network_cli_merge_regex(self):
+        regexes = [
+            re.compile(br"% ?Error"),
+            re.compile(br"invalid input", re.I),
+            re.compile(br"(?:incomplete|ambiguous) command", re.I),
+            re.compile(br"[^\r\n]+ not found"),
+            re.compile(br"^(\w+) failed$", re.M),
+        ]
+        merged = merge_regex(regexes)
+        self.assertEqual(len(merged), 3)
+        self.assertIs(merge_regex(regexes), merged)
+
+        for response in (b"% Error", b"INVALID input", b"Ambiguous command", b"x not found", b"\ncommit failed"):
+            self.assertTrue(any(r.search(response) for r in merged))
+        self.assertFalse(any(r.search(b"device#") for r in merged))
+
+    def test_network_cli__strip(self):
+        pc = PlayContext()
+        new_stdin = StringIO()
+
+        conn = network_cli.Connection(pc, new_stdin)
+        conn._terminal = MagicMock()
+        conn._terminal.ansi_re = TerminalBase.ansi_re
+
+        # the expressions are applied in list order, so the backspace does
+        # not consume the escape sequence that follows it
+        self.assertEqual(conn._strip(b'ab\x08\x1b[?1h\x1b=cd'), b'abd')
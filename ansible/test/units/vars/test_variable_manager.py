@@ -72,6 +72,26 @@ class TestVariableManager(unittest.TestCase):
 
         self.assertIsNot(v.extra_vars, extra_vars)
 
+    def test_variable_manager_version(self):
+        fake_loader = DictDataLoader({})
+
+        mock_host = MagicMock()
+        mock_host.name = 'test01'
+        mock_host.get_name.return_value = 'test01'
+        v = VariableManager(loader=fake_loader, inventory=MagicMock())
+
+        version = v._version
+        v.set_host_variable(mock_host, 'foo', 'bar')
+        self.assertGreater(v._version, version)
+
+        version = v._version
+        v.set_nonpersistent_facts(mock_host, dict(baz='bam'))
+        self.assertGreater(v._version, version)
+
+        version = v._version
+        v.invalidate_hostvars()
+        self.assertGreater(v._version, version)
+
     def test_variable_manager_play_vars(self):
         fake_loader = DictDataLoader({})
 